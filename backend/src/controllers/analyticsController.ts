@@ -2,6 +2,7 @@ import { Request, Response } from 'express';
 import { Mention } from '../models';
 import logger from '../utils/logger';
 import mongoose from 'mongoose';
+import { resolveDateRange, buildSentimentCounts, toPercentage } from '../utils/mentionStats';
 
 export const getAnalytics = async (req: Request, res: Response): Promise<void> => {
   try {
@@ -13,17 +14,10 @@ export const getAnalytics = async (req: Request, res: Response): Promise<void> =
     const userId = req.user._id;
     const { keyword, from, to, range = '7d' } = req.query;
 
-    let startDate: Date;
-    let endDate = new Date();
-
-    if (from && to) {
-      startDate = new Date(from as string);
-      endDate = new Date(to as string);
-    } else {
-      const days = range === '30d' ? 30 : range === '90d' ? 90 : 7;
-      startDate = new Date();
-      startDate.setDate(startDate.getDate() - days);
-    }
+    const { startDate, endDate } = resolveDateRange(
+      range as string,
+      from && to ? { from: from as string, to: to as string } : undefined
+    );
 
     const matchStage: Record<string, unknown> = {
       userId: new mongoose.Types.ObjectId(userId.toString()),
@@ -34,75 +28,65 @@ export const getAnalytics = async (req: Request, res: Response): Promise<void> =
       matchStage.keyword = { $regex: new RegExp(keyword as string, 'i') };
     }
 
-    const [sentimentDistribution, mentionTrend, topTopics, totalStats] = await Promise.all([
-      Mention.aggregate([
-        { $match: matchStage },
-        {
-          $group: {
-            _id: '$aiSentiment',
-            count: { $sum: 1 },
-          },
-        },
-      ]),
-
-      Mention.aggregate([
-        { $match: matchStage },
-        {
-          $group: {
-            _id: {
-              $dateToString: { format: '%Y-%m-%d', date: '$timestamp' },
+    const [facets] = await Mention.aggregate([
+      { $match: matchStage },
+      {
+        $facet: {
+          sentimentDistribution: [
+            {
+              $group: {
+                _id: '$aiSentiment',
+                count: { $sum: 1 },
+              },
             },
-            count: { $sum: 1 },
-            positive: {
-              $sum: { $cond: [{ $eq: ['$aiSentiment', 'positive'] }, 1, 0] },
+          ],
+          mentionTrend: [
+            {
+              $group: {
+                _id: {
+                  $dateToString: { format: '%Y-%m-%d', date: '$timestamp' },
+                },
+                count: { $sum: 1 },
+                positive: {
+                  $sum: { $cond: [{ $eq: ['$aiSentiment', 'positive'] }, 1, 0] },
+                },
+                negative: {
+                  $sum: { $cond: [{ $eq: ['$aiSentiment', 'negative'] }, 1, 0] },
+                },
+                neutral: {
+                  $sum: { $cond: [{ $eq: ['$aiSentiment', 'neutral'] }, 1, 0] },
+                },
+              },
             },
-            negative: {
-              $sum: { $cond: [{ $eq: ['$aiSentiment', 'negative'] }, 1, 0] },
+            { $sort: { _id: 1 } },
+          ],
+          topTopics: [
+            { $unwind: '$aiTopics' },
+            {
+              $group: {
+                _id: '$aiTopics',
+                count: { $sum: 1 },
+              },
             },
-            neutral: {
-              $sum: { $cond: [{ $eq: ['$aiSentiment', 'neutral'] }, 1, 0] },
+            { $sort: { count: -1 } },
+            { $limit: 5 },
+          ],
+          totalStats: [
+            {
+              $group: {
+                _id: null,
+                totalMentions: { $sum: 1 },
+                totalReach: { $sum: { $ifNull: ['$reach', 0] } },
+                avgEngagement: { $avg: { $ifNull: ['$engagement', 0] } },
+              },
             },
-          },
-        },
-        { $sort: { _id: 1 } },
-      ]),
-
-      Mention.aggregate([
-        { $match: matchStage },
-        { $unwind: '$aiTopics' },
-        {
-          $group: {
-            _id: '$aiTopics',
-            count: { $sum: 1 },
-          },
-        },
-        { $sort: { count: -1 } },
-        { $limit: 5 },
-      ]),
-
-      Mention.aggregate([
-        { $match: matchStage },
-        {
-          $group: {
-            _id: null,
-            totalMentions: { $sum: 1 },
-            totalReach: { $sum: { $ifNull: ['$reach', 0] } },
-            avgEngagement: { $avg: { $ifNull: ['$engagement', 0] } },
-          },
+          ],
         },
-      ]),
+      },
     ]);
+    const { sentimentDistribution, mentionTrend, topTopics, totalStats } = facets;
 
-    const sentimentMap: Record<string, number> = {
-      positive: 0,
-      negative: 0,
-      neutral: 0,
-    };
-    sentimentDistribution.forEach((item) => {
-      if (item._id) {
-        sentimentMap[item._id] = item.count;
-      }
-    });
+    const sentimentMap = buildSentimentCounts(sentimentDistribution);
 
     const total = sentimentMap.positive + sentimentMap.negative + sentimentMap.neutral;
 
@@ -169,9 +153,9 @@ export const getAnalytics = async (req: Request, res: Response): Promise<void> =
         totalMentions: stats.totalMentions,
         totalReach: stats.totalReach,
         avgEngagement: Math.round(stats.avgEngagement * 100) / 100,
-        positivePercentage: total > 0 ? Math.round((sentimentMap.positive / total) * 100) : 0,
-        negativePercentage: total > 0 ? Math.round((sentimentMap.negative / total) * 100) : 0,
-        neutralPercentage: total > 0 ? Math.round((sentimentMap.neutral / total) * 100) : 0,
+        positivePercentage: toPercentage(sentimentMap.positive, total),
+        negativePercentage: toPercentage(sentimentMap.negative, total),
+        neutralPercentage: toPercentage(sentimentMap.neutral, total),
       },
       charts: {
         sentimentDistribution: sentimentChartData,
@@ -2,9 +2,10 @@ import { Request, Response } from 'express';
 import { Mention } from '../models';
 import logger from '../utils/logger';
 import mongoose from 'mongoose';
+import { resolveDateRange, buildSentimentCounts, toPercentage } from '../utils/mentionStats';
 
 interface ReportRequest {
-  range: '7d' | '30d' | 'custom';
+  range: '7d' | '30d' | '90d' | 'custom';
   keywords?: string[];
   from?: string;
   to?: string;
@@ -21,17 +22,10 @@ export const generateReport = async (req: Request, res: Response): Promise<void>
     const userId = req.user._id;
     const { range = '7d', keywords, from, to, sections }: ReportRequest = req.body;
 
-    let startDate: Date;
-    let endDate = new Date();
-
-    if (range === 'custom' && from && to) {
-      startDate = new Date(from);
-      endDate = new Date(to);
-    } else {
-      const days = range === '30d' ? 30 : 7;
-      startDate = new Date();
-      startDate.setDate(startDate.getDate() - days);
-    }
+    const { startDate, endDate } = resolveDateRange(
+      range,
+      range === 'custom' && from && to ? { from, to } : undefined
+    );
 
     const matchStage: Record<string, unknown> = {
       userId: new mongoose.Types.ObjectId(userId.toString()),
@@ -42,56 +36,49 @@ export const generateReport = async (req: Request, res: Response): Promise<void>
       matchStage.keyword = { $in: keywords.map((k) => new RegExp(k, 'i')) };
     }
 
-    const [sentimentStats, dailyTrend, topTopics, topMentions, sourceBreakdown] = await Promise.all([
-      Mention.aggregate([
-        { $match: matchStage },
-        {
-          $group: {
-            _id: '$aiSentiment',
-            count: { $sum: 1 },
-          },
-        },
-      ]),
-
+    const [[facets], topMentions] = await Promise.all([
       Mention.aggregate([
         { $match: matchStage },
         {
-          $group: {
-            _id: { $dateToString: { format: '%Y-%m-%d', date: '$timestamp' } },
-            count: { $sum: 1 },
-            positive: { $sum: { $cond: [{ $eq: ['$aiSentiment', 'positive'] }, 1, 0] } },
-            negative: { $sum: { $cond: [{ $eq: ['$aiSentiment', 'negative'] }, 1, 0] } },
-            neutral: { $sum: { $cond: [{ $eq: ['$aiSentiment', 'neutral'] }, 1, 0] } },
+          $facet: {
+            sentimentStats: [
+              { $group: { _id: '$aiSentiment', count: { $sum: 1 } } },
+            ],
+            dailyTrend: [
+              {
+                $group: {
+                  _id: { $dateToString: { format: '%Y-%m-%d', date: '$timestamp' } },
+                  count: { $sum: 1 },
+                  positive: { $sum: { $cond: [{ $eq: ['$aiSentiment', 'positive'] }, 1, 0] } },
+                  negative: { $sum: { $cond: [{ $eq: ['$aiSentiment', 'negative'] }, 1, 0] } },
+                  neutral: { $sum: { $cond: [{ $eq: ['$aiSentiment', 'neutral'] }, 1, 0] } },
+                },
+              },
+              { $sort: { _id: 1 } },
+            ],
+            topTopics: [
+              { $unwind: '$aiTopics' },
+              { $group: { _id: '$aiTopics', count: { $sum: 1 } } },
+              { $sort: { count: -1 } },
+              { $limit: 10 },
+            ],
+            sourceBreakdown: [
+              { $group: { _id: '$source', count: { $sum: 1 } } },
+              { $sort: { count: -1 } },
+              { $limit: 10 },
+            ],
           },
         },
-        { $sort: { _id: 1 } },
-      ]),
-
-      Mention.aggregate([
-        { $match: matchStage },
-        { $unwind: '$aiTopics' },
-        { $group: { _id: '$aiTopics', count: { $sum: 1 } } },
-        { $sort: { count: -1 } },
-        { $limit: 10 },
       ]),
 
       Mention.find(matchStage)
         .sort({ reach: -1, timestamp: -1 })
         .limit(20)
         .select('keyword source text url timestamp aiSentiment aiTopics reach'),
-
-      Mention.aggregate([
-        { $match: matchStage },
-        { $group: { _id: '$source', count: { $sum: 1 } } },
-        { $sort: { count: -1 } },
-        { $limit: 10 },
-      ]),
     ]);
+    const { sentimentStats, dailyTrend, topTopics, sourceBreakdown } = facets;
 
-    const sentimentMap: Record<string, number> = { positive: 0, negative: 0, neutral: 0 };
-    sentimentStats.forEach((item) => {
-      if (item._id) sentimentMap[item._id] = item.count;
-    });
+    const sentimentMap = buildSentimentCounts(sentimentStats);
     const totalMentions = sentimentMap.positive + sentimentMap.negative + sentimentMap.neutral;
 
     const report = {
@@ -106,9 +93,9 @@ export const generateReport = async (req: Request, res: Response): Promise<void>
         positiveCount: sentimentMap.positive,
         negativeCount: sentimentMap.negative,
         neutralCount: sentimentMap.neutral,
-        positivePercentage: totalMentions > 0 ? Math.round((sentimentMap.positive / totalMentions) * 100) : 0,
-        negativePercentage: totalMentions > 0 ? Math.round((sentimentMap.negative / totalMentions) * 100) : 0,
-        neutralPercentage: totalMentions > 0 ? Math.round((sentimentMap.neutral / totalMentions) * 100) : 0,
+        positivePercentage: toPercentage(sentimentMap.positive, totalMentions),
+        negativePercentage: toPercentage(sentimentMap.negative, totalMentions),
+        neutralPercentage: toPercentage(sentimentMap.neutral, totalMentions),
       },
       charts: {
         sentimentDistribution: {
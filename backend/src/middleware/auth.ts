@@ -3,6 +3,8 @@ import jwt from 'jsonwebtoken';
 import { User, IUser } from '../models';
 import logger from '../utils/logger';
 
+const BEARER_PREFIX = 'Bearer ';
+
 interface JwtPayload {
   userId: string;
   email: string;
@@ -22,12 +24,12 @@ export const authMiddleware = async (
   try {
     const authHeader = req.headers.authorization;
 
-    if (!authHeader || !authHeader.startsWith('Bearer ')) {
+    if (!authHeader || !authHeader.startsWith(BEARER_PREFIX)) {
       res.status(401).json({ error: 'Authorization token required' });
       return;
     }
 
-    const token = authHeader.split(' ')[1];
+    const token = authHeader.slice(BEARER_PREFIX.length);
     const jwtSecret = process.env.JWT_SECRET;
 
     if (!jwtSecret) {
@@ -68,12 +70,12 @@ export const optionalAuth = async (
   try {
     const authHeader = req.headers.authorization;
 
-    if (!authHeader || !authHeader.startsWith('Bearer ')) {
+    if (!authHeader || !authHeader.startsWith(BEARER_PREFIX)) {
       next();
       return;
     }
 
-    const token = authHeader.split(' ')[1];
+    const token = authHeader.slice(BEARER_PREFIX.length);
     const jwtSecret = process.env.JWT_SECRET;
 
     if (jwtSecret) {
@@ -91,6 +91,12 @@ app.use('/api', routes);
 if (IS_PRODUCTION) {
   const publicPath = path.resolve(process.cwd(), 'public');
   if (fs.existsSync(publicPath)) {
+    // Vite fingerprints everything under /assets, so browsers can keep those
+    // files indefinitely instead of re-downloading them on every visit.
+    app.use(
+      '/assets',
+      express.static(path.join(publicPath, 'assets'), { immutable: true, maxAge: '1y' })
+    );
     app.use(express.static(publicPath));
     
     // Serve index.html for all non-API routes (SPA support)
@@ -84,34 +84,33 @@ const TOPIC_CATEGORIES = [
   'security', 'ai', 'crypto', 'social media', 'startups',
 ];
 
+const TOPIC_KEYWORDS: Record<string, string[]> = {
+  technology: ['tech', 'software', 'hardware', 'computer', 'digital', 'app', 'device', 'gadget'],
+  business: ['business', 'company', 'corporate', 'market', 'industry', 'enterprise', 'ceo', 'executive'],
+  politics: ['politics', 'government', 'election', 'vote', 'congress', 'senate', 'president', 'policy'],
+  science: ['science', 'research', 'study', 'discovery', 'scientist', 'experiment', 'lab'],
+  health: ['health', 'medical', 'doctor', 'hospital', 'disease', 'treatment', 'vaccine', 'drug'],
+  entertainment: ['movie', 'film', 'music', 'celebrity', 'actor', 'singer', 'show', 'concert'],
+  sports: ['sports', 'game', 'team', 'player', 'championship', 'league', 'score', 'win'],
+  finance: ['stock', 'invest', 'bank', 'money', 'fund', 'trading', 'wall street', 'financial'],
+  environment: ['climate', 'environment', 'green', 'sustainable', 'carbon', 'pollution', 'renewable'],
+  education: ['education', 'school', 'university', 'student', 'teacher', 'learning', 'college'],
+  security: ['security', 'cyber', 'hack', 'breach', 'privacy', 'data protection', 'encryption'],
+  ai: ['ai', 'artificial intelligence', 'machine learning', 'neural', 'chatgpt', 'openai', 'llm'],
+  crypto: ['crypto', 'bitcoin', 'blockchain', 'ethereum', 'nft', 'defi', 'web3'],
+  'social media': ['social media', 'twitter', 'facebook', 'instagram', 'tiktok', 'linkedin', 'viral'],
+  startups: ['startup', 'founder', 'venture', 'funding', 'seed', 'series a', 'unicorn', 'vc'],
+};
+
+const TOPIC_KEYWORD_ENTRIES = Object.entries(TOPIC_KEYWORDS);
+
 const classifyTopicsFallback = (text: string): string[] => {
   const lowerText = text.toLowerCase();
   const topics: string[] = [];
 
-  const topicKeywords: Record<string, string[]> = {
-    technology: ['tech', 'software', 'hardware', 'computer', 'digital', 'app', 'device', 'gadget'],
-    business: ['business', 'company', 'corporate', 'market', 'industry', 'enterprise', 'ceo', 'executive'],
-    politics: ['politics', 'government', 'election', 'vote', 'congress', 'senate', 'president', 'policy'],
-    science: ['science', 'research', 'study', 'discovery', 'scientist', 'experiment', 'lab'],
-    health: ['health', 'medical', 'doctor', 'hospital', 'disease', 'treatment', 'vaccine', 'drug'],
-    entertainment: ['movie', 'film', 'music', 'celebrity', 'actor', 'singer', 'show', 'concert'],
-    sports: ['sports', 'game', 'team', 'player', 'championship', 'league', 'score', 'win'],
-    finance: ['stock', 'invest', 'bank', 'money', 'fund', 'trading', 'wall street', 'financial'],
-    environment: ['climate', 'environment', 'green', 'sustainable', 'carbon', 'pollution', 'renewable'],
-    education: ['education', 'school', 'university', 'student', 'teacher', 'learning', 'college'],
-    security: ['security', 'cyber', 'hack', 'breach', 'privacy', 'data protection', 'encryption'],
-    ai: ['ai', 'artificial intelligence', 'machine learning', 'neural', 'chatgpt', 'openai', 'llm'],
-    crypto: ['crypto', 'bitcoin', 'blockchain', 'ethereum', 'nft', 'defi', 'web3'],
-    'social media': ['social media', 'twitter', 'facebook', 'instagram', 'tiktok', 'linkedin', 'viral'],
-    startups: ['startup', 'founder', 'venture', 'funding', 'seed', 'series a', 'unicorn', 'vc'],
-  };
-
-  for (const [topic, keywords] of Object.entries(topicKeywords)) {
-    for (const keyword of keywords) {
-      if (lowerText.includes(keyword)) {
-        topics.push(topic);
-        break;
-      }
+  for (const [topic, keywords] of TOPIC_KEYWORD_ENTRIES) {
+    if (keywords.some((keyword) => lowerText.includes(keyword))) {
+      topics.push(topic);
     }
   }
 
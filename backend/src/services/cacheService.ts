@@ -32,6 +32,27 @@ class InMemoryCache {
     return entry.data as T;
   }
 
+  /**
+   * Return the cached value for `key`, or start `load()` and cache its promise.
+   * Callers that overlap share the one in-flight load; a rejected load is
+   * evicted so the next caller retries it.
+   */
+  getOrLoad<T>(key: string, load: () => Promise<T>, ttlMs?: number): Promise<T> {
+    const cached = this.get<Promise<T>>(key);
+    if (cached) {
+      return cached;
+    }
+
+    const pending = load();
+    this.set(key, pending, ttlMs);
+    pending.catch(() => {
+      if (this.cache.get(key)?.data === pending) {
+        this.cache.delete(key);
+      }
+    });
+    return pending;
+  }
+
   delete(key: string): boolean {
     return this.cache.delete(key);
   }
@@ -81,9 +102,11 @@ class InMemoryCache {
 }
 
 export const analyticsCache = new InMemoryCache();
+export const feedCache = new InMemoryCache();
 
 setInterval(() => {
   analyticsCache.cleanup();
+  feedCache.cleanup();
 }, 60 * 1000);
 
 export const getCacheKey = (userId: string, type: string, params?: Record<string, unknown>): string => {
@@ -1,14 +1,64 @@
+import http from 'http';
+import https from 'https';
 import Parser from 'rss-parser';
-import axios from 'axios';
+import axios, { InternalAxiosRequestConfig } from 'axios';
 import logger from '../utils/logger';
+import { feedCache } from './cacheService';
 
-const parser = new Parser({
+// Feeds are downloaded through httpClient (below) and only parsed here.
+const parser = new Parser();
+
+const RSS_REQUEST_CONFIG = {
+  // Some feeds (e.g. rsshub.app) are slow to render, so allow longer than the
+  // API default.
   timeout: 10000,
+  responseType: 'text' as const,
   headers: {
     'User-Agent': 'AricaInsights/1.0 (Media Monitoring)',
+    Accept: 'application/rss+xml, application/xml;q=0.9, */*;q=0.8',
   },
+};
+
+// Shared client for every source: keep-alive agents let the feed, per-keyword
+// and Hacker News item requests reuse open connections instead of paying a new
+// TCP + TLS handshake on every call.
+const httpClient = axios.create({
+  // Search APIs answer in well under a second when healthy; anything slower
+  // than this is stalled. RSS feeds, GDELT and Hacker News override it per call.
+  timeout: 8000,
+  httpAgent: new http.Agent({ keepAlive: true, maxSockets: 10 }),
+  httpsAgent: new https.Agent({ keepAlive: true, maxSockets: 10 }),
+});
+
+// Gateway errors and dropped keep-alive sockets are usually momentary; retry
+// them over the pooled connection rather than losing a source for the cycle.
+// Timeouts are not retried so a stalled host costs one timeout, not three.
+const RETRYABLE_STATUSES = new Set([502, 503, 504]);
+const RETRYABLE_CODES = new Set(['ECONNRESET']);
+const MAX_RETRIES = 2;
+const RETRY_BASE_DELAY = 500;
+
+httpClient.interceptors.response.use(undefined, async (error) => {
+  const config = error.config as (InternalAxiosRequestConfig & { retryCount?: number }) | undefined;
+  const retryable =
+    RETRYABLE_STATUSES.has(error.response?.status) ||
+    (!error.response && RETRYABLE_CODES.has(error.code));
+
+  if (!config || !retryable || (config.retryCount ?? 0) >= MAX_RETRIES) {
+    throw error;
+  }
+
+  const attempt = (config.retryCount ?? 0) + 1;
+  config.retryCount = attempt;
+  await new Promise((resolve) => setTimeout(resolve, RETRY_BASE_DELAY * 2 ** (attempt - 1)));
+  return httpClient.request(config);
 });
 
+// Feed contents are the same for every user, so one fetch per feed is shared
+// across a poll cycle. Kept below the default 10 minute polling interval so each
+// scheduled cycle still sees fresh items.
+const FEED_CACHE_TTL = 5 * 60 * 1000;
+
 export interface FetchedMention {
   keyword: string;
   source: string;
@@ -112,21 +162,28 @@ const RSS_FEEDS = [
 ];
 
 export const fetchFromRSS = async (keywords: string[]): Promise<FetchedMention[]> => {
-  const mentions: FetchedMention[] = [];
-  const keywordPatterns = keywords.map(k => new RegExp(k, 'i'));
+  const lowerKeywords = keywords.map((k) => k.toLowerCase());
+
+  const fetchFeed = async (feed: { name: string; url: string }): Promise<FetchedMention[]> => {
+    const feedMentions: FetchedMention[] = [];
+    const cacheKey = `rss:${feed.url}`;
 
-  for (const feed of RSS_FEEDS) {
     try {
-      const result = await parser.parseURL(feed.url);
+      const items = await feedCache.getOrLoad(cacheKey, async (): Promise<Parser.Item[]> => {
+        const { data: xml } = await httpClient.get<string>(feed.url, RSS_REQUEST_CONFIG);
+        const result = await parser.parseString(xml);
+        logger.debug(`[RSS] Fetched ${result.items?.length ?? 0} items from ${feed.name}`);
+        return result.items || [];
+      }, FEED_CACHE_TTL);
       
-      for (const item of result.items || []) {
+      for (const item of items) {
         const title = item.title || '';
         const content = item.contentSnippet || item.content || '';
-        const fullText = `${title} ${content}`;
+        const fullText = `${title} ${content}`.toLowerCase();
 
         for (let i = 0; i < keywords.length; i++) {
-          if (keywordPatterns[i].test(fullText)) {
-            mentions.push({
+          if (fullText.includes(lowerKeywords[i])) {
+            feedMentions.push({
               keyword: keywords[i],
               source: feed.name,
               text: title.substring(0, 500),
@@ -138,12 +195,16 @@ export const fetchFromRSS = async (keywords: string[]): Promise<FetchedMention[]
           }
         }
       }
-      
-      logger.debug(`[RSS] Fetched ${result.items?.length || 0} items from ${feed.name}`);
     } catch (error) {
       logger.warn(`[RSS] Failed to fetch ${feed.name}: ${(error as Error).message}`);
     }
-  }
+
+    return feedMentions;
+  };
+
+  // Feeds are independent, so fetch them concurrently: a cycle now takes as long
+  // as the slowest feed rather than the sum of all of them.
+  const mentions = (await Promise.all(RSS_FEEDS.map(fetchFeed))).flat();
 
   logger.info(`[RSS] Found ${mentions.length} mentions across ${RSS_FEEDS.length} feeds`);
   return mentions;
@@ -156,17 +217,16 @@ export const fetchFromNewsData = async (keywords: string[]): Promise<FetchedMent
     return [];
   }
 
-  const mentions: FetchedMention[] = [];
+  const perKeyword = await Promise.all(keywords.map(async (keyword): Promise<FetchedMention[]> => {
+    const mentions: FetchedMention[] = [];
 
-  for (const keyword of keywords) {
     try {
-      const response = await axios.get('https://newsdata.io/api/1/news', {
+      const response = await httpClient.get('https://newsdata.io/api/1/news', {
         params: {
           apikey: apiKey,
           q: keyword,
           language: 'en',
         },
-        timeout: 10000,
       });
 
       const articles = response.data?.results || [];
@@ -190,18 +250,20 @@ export const fetchFromNewsData = async (keywords: string[]): Promise<FetchedMent
         logger.warn(`[NewsData] Error fetching "${keyword}": ${(error as Error).message}`);
       }
     }
-  }
 
-  return mentions;
+    return mentions;
+  }));
+
+  return perKeyword.flat();
 };
 
 export const fetchFromGDELT = async (keywords: string[]): Promise<FetchedMention[]> => {
-  const mentions: FetchedMention[] = [];
+  const perKeyword = await Promise.all(keywords.map(async (keyword): Promise<FetchedMention[]> => {
+    const mentions: FetchedMention[] = [];
 
-  for (const keyword of keywords) {
     try {
       const encodedKeyword = encodeURIComponent(keyword);
-      const response = await axios.get(
+      const response = await httpClient.get(
         `https://api.gdeltproject.org/api/v2/doc/doc?query=${encodedKeyword}&mode=artlist&maxrecords=50&format=json`,
         { timeout: 15000 }
       );
@@ -223,34 +285,57 @@ export const fetchFromGDELT = async (keywords: string[]): Promise<FetchedMention
     } catch (error) {
       logger.warn(`[GDELT] Error fetching "${keyword}": ${(error as Error).message}`);
     }
-  }
 
-  return mentions;
+    return mentions;
+  }));
+
+  return perKeyword.flat();
 };
 
+interface HackerNewsItem {
+  id: number;
+  title?: string;
+  text?: string;
+  url?: string;
+  time?: number;
+  score?: number;
+}
+
+const HN_CACHE_KEY = 'hn:topstories';
+
 export const fetchFromHackerNewsAPI = async (keywords: string[]): Promise<FetchedMention[]> => {
   const mentions: FetchedMention[] = [];
-  const keywordPatterns = keywords.map(k => new RegExp(k, 'i'));
+  const lowerKeywords = keywords.map((k) => k.toLowerCase());
 
   try {
-    const topStoriesRes = await axios.get('https://hacker-news.firebaseio.com/v0/topstories.json', { timeout: 10000 });
-    const storyIds = (topStoriesRes.data || []).slice(0, 100);
-
-    const storyPromises = storyIds.map((id: number) =>
-      axios.get(`https://hacker-news.firebaseio.com/v0/item/${id}.json`, { timeout: 5000 })
-        .then(res => res.data)
-        .catch(() => null)
-    );
+    // The top stories (101 requests) are the same for every user, so share
+    // them across a poll cycle like the RSS feeds.
+    const stories = await feedCache.getOrLoad(HN_CACHE_KEY, async (): Promise<HackerNewsItem[]> => {
+      const topStoriesRes = await httpClient.get('https://hacker-news.firebaseio.com/v0/topstories.json', { timeout: 5000 });
+      const storyIds: number[] = (topStoriesRes.data || []).slice(0, 100);
+
+      const storyPromises = storyIds.map((id) =>
+        httpClient.get<HackerNewsItem>(`https://hacker-news.firebaseio.com/v0/item/${id}.json`, { timeout: 5000 })
+          .then(res => res.data)
+          .catch(() => null)
+      );
 
-    const stories = (await Promise.all(storyPromises)).filter(Boolean);
+      const stories = (await Promise.all(storyPromises)).filter((story): story is HackerNewsItem => Boolean(story));
+      // Item requests swallow their own errors, so an outage shows up as an
+      // empty list. Fail instead of caching it, so the next poll retries.
+      if (storyIds.length > 0 && stories.length === 0) {
+        throw new Error('No Hacker News items could be fetched');
+      }
+      return stories;
+    }, FEED_CACHE_TTL);
 
     for (const story of stories) {
       if (!story.title) continue;
       
-      const fullText = `${story.title} ${story.text || ''}`;
+      const fullText = `${story.title} ${story.text || ''}`.toLowerCase();
       
       for (let i = 0; i < keywords.length; i++) {
-        if (keywordPatterns[i].test(fullText)) {
+        if (fullText.includes(lowerKeywords[i])) {
           mentions.push({
             keyword: keywords[i],
             source: 'Hacker News',
@@ -279,18 +364,17 @@ export const fetchFromGuardian = async (keywords: string[]): Promise<FetchedMent
     return [];
   }
 
-  const mentions: FetchedMention[] = [];
+  const perKeyword = await Promise.all(keywords.map(async (keyword): Promise<FetchedMention[]> => {
+    const mentions: FetchedMention[] = [];
 
-  for (const keyword of keywords) {
     try {
-      const response = await axios.get('https://content.guardianapis.com/search', {
+      const response = await httpClient.get('https://content.guardianapis.com/search', {
         params: {
           q: keyword,
           'api-key': apiKey,
           'page-size': 20,
           'show-fields': 'headline,trailText',
         },
-        timeout: 10000,
       });
 
       const results = response.data?.response?.results || [];
@@ -310,9 +394,11 @@ export const fetchFromGuardian = async (keywords: string[]): Promise<FetchedMent
     } catch (error) {
       logger.warn(`[Guardian] Error fetching "${keyword}": ${(error as Error).message}`);
     }
-  }
 
-  return mentions;
+    return mentions;
+  }));
+
+  return perKeyword.flat();
 };
 
 export const fetchWikipediaPageviews = async (keywords: string[]): Promise<{ keyword: string; views: number; trend: string }[]> => {
@@ -324,14 +410,13 @@ export const fetchWikipediaPageviews = async (keywords: string[]): Promise<{ key
   const startDate = new Date(endDate);
   startDate.setDate(startDate.getDate() - 7);
   
-  const formatDate = (d: Date) => d.toISOString().split('T')[0].replace(/-/g, '');
+  const formatDate = (d: Date) => d.toISOString().slice(0, 10).replaceAll('-', '');
 
   for (const keyword of keywords) {
     try {
       const articleTitle = keyword.replace(/ /g, '_');
-      const response = await axios.get(
-        `https://wikimedia.org/api/rest_v1/metrics/pageviews/per-article/en.wikipedia/all-access/all-agents/${encodeURIComponent(articleTitle)}/daily/${formatDate(startDate)}/${formatDate(endDate)}`,
-        { timeout: 10000 }
+      const response = await httpClient.get(
+        `https://wikimedia.org/api/rest_v1/metrics/pageviews/per-article/en.wikipedia/all-access/all-agents/${encodeURIComponent(articleTitle)}/daily/${formatDate(startDate)}/${formatDate(endDate)}`
       );
 
       const items = response.data?.items || [];
@@ -358,11 +443,11 @@ export const fetchWikipediaPageviews = async (keywords: string[]): Promise<{ key
 };
 
 export const fetchFromStackExchange = async (keywords: string[]): Promise<FetchedMention[]> => {
-  const mentions: FetchedMention[] = [];
+  const perKeyword = await Promise.all(keywords.map(async (keyword): Promise<FetchedMention[]> => {
+    const mentions: FetchedMention[] = [];
 
-  for (const keyword of keywords) {
     try {
-      const response = await axios.get('https://api.stackexchange.com/2.3/search/advanced', {
+      const response = await httpClient.get('https://api.stackexchange.com/2.3/search/advanced', {
         params: {
           order: 'desc',
           sort: 'activity',
@@ -370,7 +455,6 @@ export const fetchFromStackExchange = async (keywords: string[]): Promise<Fetche
           site: 'stackoverflow',
           pagesize: 20,
         },
-        timeout: 10000,
       });
 
       const items = response.data?.items || [];
@@ -390,17 +474,19 @@ export const fetchFromStackExchange = async (keywords: string[]): Promise<Fetche
     } catch (error) {
       logger.warn(`[StackExchange] Error fetching "${keyword}": ${(error as Error).message}`);
     }
-  }
 
-  return mentions;
+    return mentions;
+  }));
+
+  return perKeyword.flat();
 };
 
 export const fetchFromGitHub = async (keywords: string[]): Promise<FetchedMention[]> => {
-  const mentions: FetchedMention[] = [];
+  const perKeyword = await Promise.all(keywords.map(async (keyword): Promise<FetchedMention[]> => {
+    const mentions: FetchedMention[] = [];
 
-  for (const keyword of keywords) {
     try {
-      const response = await axios.get('https://api.github.com/search/repositories', {
+      const response = await httpClient.get('https://api.github.com/search/repositories', {
         params: {
           q: `${keyword} in:name,description`,
           sort: 'updated',
@@ -411,7 +497,6 @@ export const fetchFromGitHub = async (keywords: string[]): Promise<FetchedMentio
           'Accept': 'application/vnd.github.v3+json',
           'User-Agent': 'AricaInsights/1.0',
         },
-        timeout: 10000,
       });
 
       const items = response.data?.items || [];
@@ -435,9 +520,11 @@ export const fetchFromGitHub = async (keywords: string[]): Promise<FetchedMentio
         logger.warn(`[GitHub] Error fetching "${keyword}": ${(error as Error).message}`);
       }
     }
-  }
 
-  return mentions;
+    return mentions;
+  }));
+
+  return perKeyword.flat();
 };
 
 export const fetchAllMentions = async (keywords: string[]): Promise<FetchedMention[]> => {
@@ -466,6 +553,9 @@ export const fetchAllMentions = async (keywords: string[]): Promise<FetchedMenti
     fetchFromGitHub(keywords),
   ]);
 
+  // Mention URLs are unique in the collection, so drop repeats (the same story
+  // matched by several keywords or feeds) before they reach AI processing.
+  const seenUrls = new Set<string>();
   const allMentions = [
     ...rssMentions,
     ...newsDataMentions,
@@ -474,7 +564,11 @@ export const fetchAllMentions = async (keywords: string[]): Promise<FetchedMenti
     ...guardianMentions,
     ...stackExchangeMentions,
     ...githubMentions,
-  ];
+  ].filter((mention) => {
+    if (seenUrls.has(mention.url)) return false;
+    seenUrls.add(mention.url);
+    return true;
+  });
   
   logger.info(`[DataFetcher] Total mentions fetched: ${allMentions.length}`);
   logger.info(`[DataFetcher] Sources: RSS=${rssMentions.length}, NewsData=${newsDataMentions.length}, GDELT=${gdeltMentions.length}, HN=${hackerNewsMentions.length}, Guardian=${guardianMentions.length}, SO=${stackExchangeMentions.length}, GitHub=${githubMentions.length}`);
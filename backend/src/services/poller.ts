@@ -3,14 +3,24 @@ import { User, Mention } from '../models';
 import { fetchAllMentions, FetchedMention } from './dataFetcher';
 import { analyzeSentiment, classifyTopics } from './aiProcessor';
 import logger from '../utils/logger';
+import { createLimiter } from '../utils/concurrency';
 import { getIO } from '../socket/socketServer';
 
 let isPolling = false;
 
+// Each mention costs a lookup, two AI calls and a save. The limit is shared by
+// every user and manual refresh, so overlapping polls can't multiply the load
+// on the HF inference API.
+const limitMention = createLimiter(5);
+
+// Users are independent, so a few are fetched and processed side by side.
+// Kept small because each user already fans out to every source per keyword.
+const limitUser = createLimiter(3);
+
 const processMention = async (
   mention: FetchedMention,
   userId: string
-): Promise<void> => {
+): Promise<boolean> => {
   try {
     const existingMention = await Mention.findOne({
       userId,
@@ -19,7 +29,7 @@ const processMention = async (
     });
 
     if (existingMention) {
-      return;
+      return false;
     }
 
     const [sentiment, topics] = await Promise.all([
@@ -55,8 +65,11 @@ const processMention = async (
         aiTopics: newMention.aiTopics,
       });
     }
+
+    return true;
   } catch (error) {
     logger.error(`[Poller] Error processing mention: ${(error as Error).message}`);
+    return false;
   }
 };
 
@@ -76,23 +89,21 @@ export const pollForAllUsers = async (): Promise<{ usersProcessed: number; menti
     const users = await User.find({ keywords: { $exists: true, $ne: [] } });
     logger.info(`[Poller] Found ${users.length} users with keywords`);
 
-    for (const user of users) {
+    await Promise.all(users.map((user) => limitUser(async () => {
       try {
         const keywords = user.keywords || [];
-        if (keywords.length === 0) continue;
+        if (keywords.length === 0) return;
 
         logger.info(`[Poller] Fetching for user ${user.email} with ${keywords.length} keywords`);
 
         const mentions = await fetchAllMentions(keywords);
-        
-        const beforeCount = await Mention.countDocuments({ userId: user._id });
+        const userId = user._id.toString();
 
-        for (const mention of mentions) {
-          await processMention(mention, user._id.toString());
-        }
+        const results = await Promise.all(
+          mentions.map((mention) => limitMention(() => processMention(mention, userId)))
+        );
 
-        const afterCount = await Mention.countDocuments({ userId: user._id });
-        const added = afterCount - beforeCount;
+        const added = results.filter(Boolean).length;
         mentionsAdded += added;
 
         logger.info(`[Poller] Added ${added} new mentions for user ${user.email}`);
@@ -100,7 +111,7 @@ export const pollForAllUsers = async (): Promise<{ usersProcessed: number; menti
       } catch (error) {
         logger.error(`[Poller] Error processing user ${user.email}: ${(error as Error).message}`);
       }
-    }
+    })));
 
     logger.info(`[Poller] Poll cycle complete. Users: ${usersProcessed}, Mentions added: ${mentionsAdded}`);
   } catch (error) {
@@ -131,14 +142,12 @@ export const pollForUser = async (userId: string): Promise<{ mentionsAdded: numb
     logger.info(`[Poller] Manual poll for user ${user.email} with ${keywords.length} keywords`);
 
     const mentions = await fetchAllMentions(keywords);
-    const beforeCount = await Mention.countDocuments({ userId: user._id });
 
-    for (const mention of mentions) {
-      await processMention(mention, user._id.toString());
-    }
+    const results = await Promise.all(
+      mentions.map((mention) => limitMention(() => processMention(mention, userId)))
+    );
 
-    const afterCount = await Mention.countDocuments({ userId: user._id });
-    mentionsAdded = afterCount - beforeCount;
+    mentionsAdded = results.filter(Boolean).length;
 
     logger.info(`[Poller] Manual poll complete. Added ${mentionsAdded} mentions for user ${user.email}`);
   } catch (error) {
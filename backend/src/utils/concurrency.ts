@@ -0,0 +1,30 @@
+export type Limiter = <T>(task: () => Promise<T>) => Promise<T>;
+
+/**
+ * Create a limiter that runs at most `maxConcurrent` tasks at a time. Extra
+ * tasks queue in call order and start as soon as a running task settles.
+ */
+export const createLimiter = (maxConcurrent: number): Limiter => {
+  let active = 0;
+  const waiters: Array<() => void> = [];
+
+  return async <T>(task: () => Promise<T>): Promise<T> => {
+    if (active >= maxConcurrent) {
+      // The finishing task hands its slot straight to us, so no increment here.
+      await new Promise<void>((resolve) => waiters.push(resolve));
+    } else {
+      active++;
+    }
+
+    try {
+      return await task();
+    } finally {
+      const next = waiters.shift();
+      if (next) {
+        next();
+      } else {
+        active--;
+      }
+    }
+  };
+};
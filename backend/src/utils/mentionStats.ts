@@ -0,0 +1,38 @@
+const RANGE_DAYS: Record<string, number> = { '7d': 7, '30d': 30, '90d': 90 };
+
+export interface DateRange {
+  startDate: Date;
+  endDate: Date;
+}
+
+export type SentimentCounts = Record<string, number>;
+
+/**
+ * Resolve a preset range ('7d', '30d', '90d') ending now, or an explicit
+ * from/to window when one is supplied. Unknown presets fall back to 7 days.
+ */
+export const resolveDateRange = (
+  range: string | undefined,
+  custom?: { from: string; to: string }
+): DateRange => {
+  if (custom) {
+    return { startDate: new Date(custom.from), endDate: new Date(custom.to) };
+  }
+
+  const startDate = new Date();
+  startDate.setDate(startDate.getDate() - (RANGE_DAYS[range ?? ''] ?? 7));
+  return { startDate, endDate: new Date() };
+};
+
+export const buildSentimentCounts = (
+  groups: Array<{ _id: string | null; count: number }>
+): SentimentCounts => {
+  const counts: SentimentCounts = { positive: 0, negative: 0, neutral: 0 };
+  for (const group of groups) {
+    if (group._id) counts[group._id] = group.count;
+  }
+  return counts;
+};
+
+export const toPercentage = (part: number, total: number): number =>
+  total > 0 ? Math.round((part / total) * 100) : 0;
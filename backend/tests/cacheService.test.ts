@@ -0,0 +1,30 @@
+import { feedCache } from '../src/services/cacheService';
+
+describe('InMemoryCache', () => {
+  describe('getOrLoad', () => {
+    it('should share one load between overlapping callers', async () => {
+      let resolveLoad!: (value: string[]) => void;
+      const load = jest.fn(() => new Promise<string[]>((resolve) => {
+        resolveLoad = resolve;
+      }));
+
+      const first = feedCache.getOrLoad('test:overlap', load);
+      const second = feedCache.getOrLoad('test:overlap', load);
+      resolveLoad(['item']);
+
+      expect(await first).toEqual(['item']);
+      expect(await second).toEqual(['item']);
+      expect(load).toHaveBeenCalledTimes(1);
+    });
+
+    it('should evict a rejected load so the next caller retries', async () => {
+      const load = jest.fn()
+        .mockRejectedValueOnce(new Error('feed unavailable'))
+        .mockResolvedValueOnce(['item']);
+
+      await expect(feedCache.getOrLoad('test:retry', load)).rejects.toThrow('feed unavailable');
+      expect(await feedCache.getOrLoad('test:retry', load)).toEqual(['item']);
+      expect(load).toHaveBeenCalledTimes(2);
+    });
+  });
+});
@@ -0,0 +1,57 @@
+import { createLimiter } from '../src/utils/concurrency';
+
+const tick = () => new Promise<void>((resolve) => setTimeout(resolve, 5));
+
+describe('createLimiter', () => {
+  it('should run no more than the limit at once', async () => {
+    const limit = createLimiter(5);
+    let active = 0;
+    let peak = 0;
+
+    const results = await Promise.all(
+      Array.from({ length: 12 }, (_, i) => limit(async () => {
+        active++;
+        peak = Math.max(peak, active);
+        await tick();
+        active--;
+        return i;
+      }))
+    );
+
+    expect(peak).toBe(5);
+    expect(results).toEqual(Array.from({ length: 12 }, (_, i) => i));
+  });
+
+  it('should release the slot when a task rejects', async () => {
+    const limit = createLimiter(1);
+
+    await expect(limit(async () => {
+      throw new Error('boom');
+    })).rejects.toThrow('boom');
+
+    await expect(limit(async () => 'next')).resolves.toBe('next');
+  });
+
+  it('should hand the slot to a queued task after a rejection', async () => {
+    const limit = createLimiter(5);
+    let active = 0;
+    let peak = 0;
+
+    const tasks = Array.from({ length: 10 }, (_, i) => limit(async () => {
+      active++;
+      peak = Math.max(peak, active);
+      await tick();
+      active--;
+      if (i % 2 === 0) {
+        throw new Error(`task ${i} failed`);
+      }
+      return i;
+    }));
+
+    const settled = await Promise.allSettled(tasks);
+
+    expect(peak).toBeLessThanOrEqual(5);
+    expect(settled.filter((result) => result.status === 'fulfilled')).toHaveLength(5);
+    expect(settled.filter((result) => result.status === 'rejected')).toHaveLength(5);
+  });
+});
@@ -70,6 +70,18 @@ describe('Reports API', () => {
       expect(response.body.summary.totalMentions).toBeGreaterThan(0);
     });
 
+    it('should cover 90 days for a 90d report', async () => {
+      const response = await request(app)
+        .post('/api/reports/generate')
+        .set('Authorization', `Bearer ${token}`)
+        .send({ range: '90d' });
+
+      expect(response.status).toBe(200);
+      const { from, to } = response.body.metadata.dateRange;
+      const days = Math.round((new Date(to).getTime() - new Date(from).getTime()) / 86400000);
+      expect(days).toBe(90);
+    });
+
     it('should filter by keywords', async () => {
       const response = await request(app)
         .post('/api/reports/generate')
@@ -13,9 +13,27 @@ import Login from "./pages/Login";
 import NotFound from "./pages/NotFound";
 
 // Lazy load heavy pages for better performance
-const Analytics = lazy(() => import("./pages/Analytics"));
-const Reports = lazy(() => import("./pages/Reports"));
-const Settings = lazy(() => import("./pages/Settings"));
+const loadAnalytics = () => import("./pages/Analytics");
+const loadReports = () => import("./pages/Reports");
+const loadSettings = () => import("./pages/Settings");
+
+const Analytics = lazy(loadAnalytics);
+const Reports = lazy(loadReports);
+const Settings = lazy(loadSettings);
+
+// Fetch the lazy page chunks once the browser is idle so navigating to them
+// doesn't wait on the network. Failures are ignored; lazy() retries on render.
+const prefetchPages = () => {
+  for (const load of [loadAnalytics, loadReports, loadSettings]) {
+    load().catch(() => undefined);
+  }
+};
+
+if ("requestIdleCallback" in window) {
+  window.requestIdleCallback(prefetchPages, { timeout: 5000 });
+} else {
+  setTimeout(prefetchPages, 2000);
+}
 
 const queryClient = new QueryClient({
   defaultOptions: {
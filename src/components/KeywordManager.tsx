@@ -1,4 +1,4 @@
-import { useState } from "react";
+import { useState, useMemo } from "react";
 import { useForm } from "react-hook-form";
 import { motion, AnimatePresence } from "framer-motion";
 import { Plus, X, Hash, Loader2 } from "lucide-react";
@@ -51,12 +51,17 @@ export function KeywordManager({ className, compact = false }: KeywordManagerPro
 
   const keywordValue = watch("keyword", "");
 
-  const filteredSuggestions = suggestions.filter(
-    (s) =>
-      s.toLowerCase().includes(keywordValue.toLowerCase()) &&
-      !keywords.some((k) => k.text.toLowerCase() === s.toLowerCase())
+  const existingKeywords = useMemo(
+    () => new Set(keywords.map((k) => k.text.toLowerCase())),
+    [keywords]
   );
 
+  const query = keywordValue.toLowerCase();
+  const filteredSuggestions = suggestions.filter((s) => {
+    const lower = s.toLowerCase();
+    return lower.includes(query) && !existingKeywords.has(lower);
+  });
+
   const onSubmit = async (data: KeywordFormData) => {
     // Validate with yup
     try {
@@ -69,7 +74,7 @@ export function KeywordManager({ className, compact = false }: KeywordManagerPro
     }
 
     // Check for duplicates
-    if (keywords.some((k) => k.text.toLowerCase() === data.keyword.toLowerCase())) {
+    if (existingKeywords.has(data.keyword.toLowerCase())) {
       toast.error("This keyword already exists");
       return;
     }
@@ -16,6 +16,18 @@ interface StatCounterProps {
   compact?: boolean;
 }
 
+const trendIcon = {
+  up: <TrendingUp className="w-4 h-4" />,
+  down: <TrendingDown className="w-4 h-4" />,
+  neutral: <Minus className="w-4 h-4" />,
+};
+
+const trendColor = {
+  up: 'text-positive',
+  down: 'text-negative',
+  neutral: 'text-muted-foreground',
+};
+
 function formatNumber(num: number): string {
   if (num >= 1000000) {
     return (num / 1000000).toFixed(1) + 'M';
@@ -41,6 +53,9 @@ export function StatCounter({
   const [displayValue, setDisplayValue] = useState(0);
   const [hasAnimated, setHasAnimated] = useState(false);
   const ref = useRef<HTMLDivElement>(null);
+  const frameRef = useRef(0);
+
+  useEffect(() => () => cancelAnimationFrame(frameRef.current), []);
 
   useEffect(() => {
     const observer = new IntersectionObserver(
@@ -48,19 +63,18 @@ export function StatCounter({
         if (entries[0].isIntersecting && !hasAnimated) {
           setHasAnimated(true);
           const duration = 2000;
-          const steps = 60;
-          const increment = value / steps;
-          let current = 0;
+          const start = performance.now();
 
-          const timer = setInterval(() => {
-            current += increment;
-            if (current >= value) {
-              setDisplayValue(value);
-              clearInterval(timer);
-            } else {
-              setDisplayValue(Math.floor(current));
+          // Step once per display frame so updates line up with repaints and
+          // pause while the tab is hidden.
+          const tick = (now: number) => {
+            const progress = Math.min((now - start) / duration, 1);
+            setDisplayValue(progress < 1 ? Math.floor(value * progress) : value);
+            if (progress < 1) {
+              frameRef.current = requestAnimationFrame(tick);
             }
-          }, duration / steps);
+          };
+          frameRef.current = requestAnimationFrame(tick);
         }
       },
       { threshold: 0.1 }
@@ -73,18 +87,6 @@ export function StatCounter({
     return () => observer.disconnect();
   }, [value, hasAnimated]);
 
-  const trendIcon = {
-    up: <TrendingUp className="w-4 h-4" />,
-    down: <TrendingDown className="w-4 h-4" />,
-    neutral: <Minus className="w-4 h-4" />,
-  };
-
-  const trendColor = {
-    up: 'text-positive',
-    down: 'text-negative',
-    neutral: 'text-muted-foreground',
-  };
-
   return (
     <motion.div
       ref={ref}
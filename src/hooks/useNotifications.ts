@@ -1,4 +1,4 @@
-import { useState, useEffect, useCallback } from "react";
+import { useState, useEffect, useCallback, useMemo } from "react";
 
 interface Notification {
   id: string;
@@ -37,7 +37,10 @@ export function useNotifications() {
     },
   ]);
 
-  const unreadCount = notifications.filter((n) => !n.read).length;
+  const unreadCount = useMemo(
+    () => notifications.reduce((count, n) => (n.read ? count : count + 1), 0),
+    [notifications]
+  );
 
   const markAsRead = useCallback((id: string) => {
     setNotifications((prev) =>
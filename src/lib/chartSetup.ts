@@ -0,0 +1,5 @@
+import { Chart as ChartJS } from 'chart.js';
+
+// Global Chart.js defaults, shared by every page that renders charts.
+// Match the app's typeface once instead of repeating it in every font option.
+ChartJS.defaults.font.family = "'Inter', system-ui, sans-serif";
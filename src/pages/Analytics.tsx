@@ -1,4 +1,4 @@
-import { useState, useCallback } from "react";
+import { useState, useCallback, useMemo } from "react";
 import { useQuery } from "@tanstack/react-query";
 import { motion, AnimatePresence } from "framer-motion";
 import { 
@@ -19,6 +19,7 @@ import {
   Legend,
   Filler,
 } from 'chart.js';
+import "@/lib/chartSetup";
 import { Doughnut, Line, Bar } from 'react-chartjs-2';
 import { AppLayout } from "@/components/AppLayout";
 import { PageTransition } from "@/components/PageTransition";
@@ -54,6 +55,71 @@ const chartColors = {
 
 const sources = ['Twitter', 'News', 'LinkedIn', 'Reddit', 'Blogs'];
 
+const chartOptions = {
+  responsive: true,
+  maintainAspectRatio: false,
+  plugins: {
+    legend: {
+      display: false,
+    },
+    tooltip: {
+      backgroundColor: 'rgba(15, 23, 42, 0.95)',
+      titleColor: '#fff',
+      bodyColor: '#94a3b8',
+      borderColor: 'rgba(255, 255, 255, 0.1)',
+      borderWidth: 1,
+      padding: 12,
+      cornerRadius: 8,
+      displayColors: true,
+    },
+  },
+};
+
+const doughnutOptions = {
+  ...chartOptions,
+  plugins: {
+    ...chartOptions.plugins,
+    legend: {
+      display: true,
+      position: 'bottom' as const,
+      labels: {
+        usePointStyle: true,
+        padding: 20,
+        font: { size: 12 },
+      },
+    },
+  },
+};
+
+const lineOptions = {
+  ...chartOptions,
+  scales: {
+    x: {
+      grid: { display: false },
+      ticks: { font: { size: 11 } },
+    },
+    y: {
+      grid: { color: 'rgba(0, 0, 0, 0.05)' },
+      ticks: { font: { size: 11 } },
+    },
+  },
+};
+
+const barOptions = {
+  ...chartOptions,
+  indexAxis: 'y' as const,
+  scales: {
+    x: {
+      grid: { color: 'rgba(0, 0, 0, 0.05)' },
+      ticks: { font: { size: 11 } },
+    },
+    y: {
+      grid: { display: false },
+      ticks: { font: { size: 12 } },
+    },
+  },
+};
+
 // Types for API responses
 interface AnalyticsOverview {
   summary: {
@@ -85,6 +151,7 @@ export default function Analytics() {
   const { 
     data: analyticsData, 
     isLoading, 
+    isFetching: isRefreshing,
     error: analyticsError,
     refetch: refetchAnalytics 
   } = useQuery<AnalyticsOverview>({
@@ -104,7 +171,10 @@ export default function Analytics() {
     queryFn: () => keywordsApi.getAll(),
   });
 
-  const userKeywords = keywordsData?.keywords?.map(k => k.keyword) || [];
+  const userKeywords = useMemo(
+    () => keywordsData?.keywords?.map(k => k.keyword) || [],
+    [keywordsData]
+  );
 
   // Handle refresh
   const handleRefresh = useCallback(async () => {
@@ -113,21 +183,21 @@ export default function Analytics() {
     toast.success("Analytics refreshed!");
   }, [refetchAnalytics]);
 
-  const toggleKeyword = (keyword: string) => {
+  const toggleKeyword = useCallback((keyword: string) => {
     setSelectedKeywords(prev =>
       prev.includes(keyword)
         ? prev.filter(k => k !== keyword)
         : [...prev, keyword]
     );
-  };
+  }, []);
 
-  const toggleSource = (source: string) => {
+  const toggleSource = useCallback((source: string) => {
     setSelectedSources(prev =>
       prev.includes(source)
         ? prev.filter(s => s !== source)
         : [...prev, source]
     );
-  };
+  }, []);
 
   // Extract data from API response with fallbacks
   const summary = analyticsData?.summary || {
@@ -199,71 +269,6 @@ export default function Analytics() {
     }],
   };
 
-  const chartOptions = {
-    responsive: true,
-    maintainAspectRatio: false,
-    plugins: {
-      legend: {
-        display: false,
-      },
-      tooltip: {
-        backgroundColor: 'rgba(15, 23, 42, 0.95)',
-        titleColor: '#fff',
-        bodyColor: '#94a3b8',
-        borderColor: 'rgba(255, 255, 255, 0.1)',
-        borderWidth: 1,
-        padding: 12,
-        cornerRadius: 8,
-        displayColors: true,
-      },
-    },
-  };
-
-  const doughnutOptions = {
-    ...chartOptions,
-    plugins: {
-      ...chartOptions.plugins,
-      legend: {
-        display: true,
-        position: 'bottom' as const,
-        labels: {
-          usePointStyle: true,
-          padding: 20,
-          font: { size: 12, family: 'Inter' },
-        },
-      },
-    },
-  };
-
-  const lineOptions = {
-    ...chartOptions,
-    scales: {
-      x: {
-        grid: { display: false },
-        ticks: { font: { size: 11, family: 'Inter' } },
-      },
-      y: {
-        grid: { color: 'rgba(0, 0, 0, 0.05)' },
-        ticks: { font: { size: 11, family: 'Inter' } },
-      },
-    },
-  };
-
-  const barOptions = {
-    ...chartOptions,
-    indexAxis: 'y' as const,
-    scales: {
-      x: {
-        grid: { color: 'rgba(0, 0, 0, 0.05)' },
-        ticks: { font: { size: 11, family: 'Inter' } },
-      },
-      y: {
-        grid: { display: false },
-        ticks: { font: { size: 12, family: 'Inter' } },
-      },
-    },
-  };
-
   // Get top topic from API data
   const topTopic = topTopics.length > 0 ? topTopics[0] : null;
 
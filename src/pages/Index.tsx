@@ -14,6 +14,7 @@ import { Button } from "@/components/ui/button";
 import { Input } from "@/components/ui/input";
 import { toast } from "sonner";
 import { useSettings } from "@/hooks/useSettings";
+import { useDebouncedValue } from "@/hooks/useDebouncedValue";
 import { cn } from "@/lib/utils";
 import { mentionsApi, analyticsApi } from "@/lib/api";
 
@@ -51,9 +52,9 @@ type FilterType = 'all' | Sentiment;
 
 export default function Dashboard() {
   const [searchQuery, setSearchQuery] = useState("");
+  const debouncedSearchQuery = useDebouncedValue(searchQuery.trim());
   const [activeFilter, setActiveFilter] = useState<FilterType>('all');
   const [page, setPage] = useState(1);
-  const loadMoreRef = useRef<HTMLDivElement>(null);
   const { dashboardLayout } = useSettings();
 
   // Fetch mentions from API
@@ -63,7 +64,7 @@ export default function Dashboard() {
     error: mentionsError,
     refetch: refetchMentions 
   } = useQuery({
-    queryKey: ['mentions', page, activeFilter, searchQuery],
+    queryKey: ['mentions', page, activeFilter, debouncedSearchQuery],
     queryFn: async () => {
       const params: Record<string, string | number> = {
         page,
@@ -72,8 +73,8 @@ export default function Dashboard() {
       if (activeFilter !== 'all') {
         params.sentiment = activeFilter;
       }
-      if (searchQuery) {
-        params.keyword = searchQuery;
+      if (debouncedSearchQuery) {
+        params.keyword = debouncedSearchQuery;
       }
       return mentionsApi.getAll(params);
     },
@@ -144,28 +145,43 @@ export default function Dashboard() {
       setPage((prev) => prev + 1);
     }, [hasMore, mentionsLoading]);
 
-    // Infinite scroll observer
+    // Infinite scroll observer. One observer lives for as long as the sentinel
+    // is mounted; the latest loadMore is read through a ref so page loads don't
+    // tear it down and re-create it.
+    const loadMoreLatest = useRef(loadMore);
+    const sentinelVisible = useRef(false);
+    const observerRef = useRef<IntersectionObserver | null>(null);
+
     useEffect(() => {
-      const observer = new IntersectionObserver(
+      loadMoreLatest.current = loadMore;
+      // Keep filling while the sentinel is still on screen after a page lands.
+      if (sentinelVisible.current) {
+        loadMore();
+      }
+    }, [loadMore]);
+
+    const loadMoreRef = useCallback((node: HTMLDivElement | null) => {
+      observerRef.current?.disconnect();
+      observerRef.current = null;
+      sentinelVisible.current = false;
+      if (!node) return;
+
+      observerRef.current = new IntersectionObserver(
         (entries) => {
-          if (entries[0].isIntersecting && hasMore && !mentionsLoading) {
-            loadMore();
+          sentinelVisible.current = entries[0].isIntersecting;
+          if (entries[0].isIntersecting) {
+            loadMoreLatest.current();
           }
         },
         { threshold: 0.1 }
       );
-
-      if (loadMoreRef.current) {
-        observer.observe(loadMoreRef.current);
-      }
-
-      return () => observer.disconnect();
-    }, [loadMore, hasMore, mentionsLoading]);
+      observerRef.current.observe(node);
+    }, []);
 
     // Reset page when filter changes
     useEffect(() => {
       setPage(1);
-    }, [activeFilter, searchQuery]);
+    }, [activeFilter, debouncedSearchQuery]);
 
     const handleRefresh = async () => {
       toast.info("Refreshing data...");
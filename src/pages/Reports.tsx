@@ -1,4 +1,4 @@
-import { useState, useRef } from "react";
+import { useState, useRef, useMemo, useCallback } from "react";
 import { useQuery } from "@tanstack/react-query";
 import { motion } from "framer-motion";
 import { 
@@ -6,8 +6,6 @@ import {
   Loader2, BarChart3, TrendingUp 
 } from "lucide-react";
 import { useForm } from "react-hook-form";
-import jsPDF from "jspdf";
-import html2canvas from "html2canvas";
 import {
   Chart as ChartJS,
   CategoryScale,
@@ -21,6 +19,7 @@ import {
   Legend,
   Filler,
 } from 'chart.js';
+import "@/lib/chartSetup";
 import { Doughnut, Line } from 'react-chartjs-2';
 import { AppLayout } from "@/components/AppLayout";
 import { PageTransition } from "@/components/PageTransition";
@@ -57,6 +56,27 @@ ChartJS.register(
   Filler
 );
 
+const miniChartOptions = {
+  responsive: true,
+  maintainAspectRatio: false,
+  plugins: { legend: { display: false } },
+  scales: {
+    x: { display: false },
+    y: { display: false },
+  },
+};
+
+const miniDoughnutOptions = {
+  ...miniChartOptions,
+  plugins: {
+    legend: {
+      display: true,
+      position: 'bottom' as const,
+      labels: { boxWidth: 12, padding: 8, font: { size: 10 } },
+    },
+  },
+};
+
 interface ReportFormData {
   reportName: string;
   period: string;
@@ -122,7 +142,7 @@ export default function Reports() {
   const [isGenerating, setIsGenerating] = useState(false);
   const [isExporting, setIsExporting] = useState(false);
   const [showPreview, setShowPreview] = useState(false);
-  const [selectedSections, setSelectedSections] = useState<string[]>(sections);
+  const [selectedSections, setSelectedSections] = useState<Set<string>>(() => new Set(sections));
   const [selectedKeywords, setSelectedKeywords] = useState<string[]>([]);
   const [reportData, setReportData] = useState<{
     summary: AnalyticsSummary;
@@ -143,7 +163,10 @@ export default function Reports() {
     queryFn: () => reportsApi.getHistory(),
   });
 
-  const userKeywords = keywordsData?.keywords?.map(k => k.keyword) || [];
+  const userKeywords = useMemo(
+    () => keywordsData?.keywords?.map(k => k.keyword) || [],
+    [keywordsData]
+  );
   const reportHistory = reportHistoryData?.reports || [];
 
   const { register, watch, formState: { errors } } = useForm<ReportFormData>({
@@ -188,23 +211,23 @@ export default function Reports() {
     }
   };
 
-  const handleSectionToggle = (section: string) => {
-    setSelectedSections(prev => 
-      prev.includes(section) 
-        ? prev.filter(s => s !== section)
-        : [...prev, section]
-    );
-  };
+  const handleSectionToggle = useCallback((section: string) => {
+    setSelectedSections(prev => {
+      const next = new Set(prev);
+      if (!next.delete(section)) next.add(section);
+      return next;
+    });
+  }, []);
 
-  const toggleKeyword = (keyword: string) => {
+  const toggleKeyword = useCallback((keyword: string) => {
     setSelectedKeywords(prev =>
       prev.includes(keyword)
         ? prev.filter(k => k !== keyword)
         : [...prev, keyword]
     );
-  };
+  }, []);
 
-  const getPeriodDates = () => {
+  const periodDates = useMemo(() => {
     const end = new Date();
     const start = new Date();
     switch (period) {
@@ -217,7 +240,7 @@ export default function Reports() {
       start: start.toLocaleDateString('en-US', { month: 'short', day: 'numeric', year: 'numeric' }),
       end: end.toLocaleDateString('en-US', { month: 'short', day: 'numeric', year: 'numeric' }),
     };
-  };
+  }, [period]);
 
   const exportToPDF = async () => {
     if (!previewRef.current) return;
@@ -226,6 +249,12 @@ export default function Reports() {
     toast.info("Generating PDF report...");
 
     try {
+      // Loaded on demand so the PDF toolchain stays out of the Reports chunk.
+      const [{ default: html2canvas }, { default: jsPDF }] = await Promise.all([
+        import("html2canvas"),
+        import("jspdf"),
+      ]);
+
       const canvas = await html2canvas(previewRef.current, {
         scale: 2,
         useCORS: true,
@@ -264,8 +293,7 @@ export default function Reports() {
       
       pdf.setFontSize(10);
       pdf.setTextColor(100, 116, 139);
-      const dates = getPeriodDates();
-      pdf.text(`Report Period: ${dates.start} - ${dates.end}`, margin, yPosition);
+      pdf.text(`Report Period: ${periodDates.start} - ${periodDates.end}`, margin, yPosition);
       yPosition += 5;
       pdf.text(`Generated: ${new Date().toLocaleDateString('en-US', { 
         weekday: 'long', year: 'numeric', month: 'long', day: 'numeric' 
@@ -398,16 +426,6 @@ export default function Reports() {
       }],
     };
 
-  const miniChartOptions = {
-    responsive: true,
-    maintainAspectRatio: false,
-    plugins: { legend: { display: false } },
-    scales: {
-      x: { display: false },
-      y: { display: false },
-    },
-  };
-
   return (
     <AppLayout>
       <PageTransition>
@@ -499,7 +517,7 @@ export default function Reports() {
                           <div key={section} className="flex items-center gap-2">
                             <Checkbox 
                               id={section} 
-                              checked={selectedSections.includes(section)}
+                              checked={selectedSections.has(section)}
                               onCheckedChange={() => handleSectionToggle(section)}
                             />
                             <Label htmlFor={section} className="text-sm font-normal cursor-pointer">
@@ -628,12 +646,12 @@ export default function Reports() {
                         <div className="border-b border-border pb-4">
                           <h2 className="text-2xl font-bold text-foreground">{reportName || 'Weekly Brand Report'}</h2>
                           <p className="text-sm text-muted-foreground mt-1">
-                            {getPeriodDates().start} – {getPeriodDates().end}
+                            {periodDates.start} – {periodDates.end}
                           </p>
                         </div>
 
                                                 {/* Summary Stats */}
-                                                {selectedSections.includes('Executive Summary') && (
+                                                {selectedSections.has('Executive Summary') && (
                                                   <div className="grid grid-cols-4 gap-4">
                                                     <div className="p-4 rounded-xl bg-primary/5 border border-primary/10">
                                                       <p className="text-xs text-muted-foreground mb-1">Total Mentions</p>
@@ -655,7 +673,7 @@ export default function Reports() {
                                                 )}
 
                         {/* Charts Row */}
-                        {selectedSections.includes('Sentiment Analysis') && (
+                        {selectedSections.has('Sentiment Analysis') && (
                           <div className="grid grid-cols-2 gap-6">
                             <div className="p-4 rounded-xl bg-muted/30 border border-border">
                               <div className="flex items-center gap-2 mb-4">
@@ -663,16 +681,7 @@ export default function Reports() {
                                 <h3 className="font-semibold text-sm">Sentiment Distribution</h3>
                               </div>
                               <div className="h-[180px]">
-                                <Doughnut data={sentimentDoughnutData} options={{
-                                  ...miniChartOptions,
-                                  plugins: {
-                                    legend: {
-                                      display: true,
-                                      position: 'bottom',
-                                      labels: { boxWidth: 12, padding: 8, font: { size: 10 } }
-                                    }
-                                  }
-                                }} />
+                                <Doughnut data={sentimentDoughnutData} options={miniDoughnutOptions} />
                               </div>
                             </div>
                             <div className="p-4 rounded-xl bg-muted/30 border border-border">
@@ -688,7 +697,7 @@ export default function Reports() {
                         )}
 
                                                 {/* Top Mentions Table */}
-                                                {selectedSections.includes('Top Mentions') && (
+                                                {selectedSections.has('Top Mentions') && (
                                                   <div>
                                                     <h3 className="font-semibold text-sm mb-3 flex items-center gap-2">
                                                       <FileText className="w-4 h-4 text-primary" />